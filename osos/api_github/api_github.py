@@ -4,23 +4,210 @@ Interface module for github API
 """
 import re
 import datetime
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from warnings import warn
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'osos')
+
+
+class _CachedResponse:
+    """Lightweight stand-in for requests.models.Response built from a cached
+    database row when github returns 304 Not Modified."""
+
+    def __init__(self, status_code, content, links, headers=None):
+        """
+        Parameters
+        ----------
+        status_code : int
+            Original http status code of the cached response (e.g. 200).
+        content : bytes
+            Raw response body.
+        links : dict
+            Parsed pagination "Link" header from the original response.
+        headers : dict | None
+            Original response headers, if available.
+        """
+        self.status_code = status_code
+        self.content = content
+        self.links = links
+        self.headers = headers or {}
+        self.reason = 'OK'
+        self.text = content.decode('utf-8')
+
+    def json(self):
+        """Parse the cached response body as json."""
+        return json.loads(self.content)
+
+
+class _CacheStore:
+    """SQLite-backed store of github API responses keyed on token + url +
+    params so unchanged endpoints can be revalidated with conditional
+    (If-None-Match / If-Modified-Since) requests that do not count against
+    the github rate limit. Safe to share across threads."""
+
+    def __init__(self, fpath=None):
+        """
+        Parameters
+        ----------
+        fpath : str | None
+            Path to the sqlite cache file. Defaults to
+            ~/.cache/osos/http.sqlite
+        """
+        if fpath is None:
+            fpath = os.path.join(CACHE_DIR, 'http.sqlite')
+
+        os.makedirs(os.path.dirname(fpath), exist_ok=True)
+        # sqlite connections refuse cross-thread use by default, but the
+        # store is shared by concurrent requests (e.g. collect_all), so
+        # allow it and serialize all access behind a lock instead
+        self._db = sqlite3.connect(fpath, timeout=30,
+                                   check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses '
+                             '(key TEXT PRIMARY KEY, etag TEXT, '
+                             'last_modified TEXT, status INTEGER, body BLOB, '
+                             'links TEXT, fetched_at REAL)')
+            self._db.commit()
+
+    @staticmethod
+    def make_key(token, url, params=None):
+        """Make a unique cache key for a request.
+
+        Parameters
+        ----------
+        token : str
+            Github api authorization token. Only a short hash is stored so
+            responses are not shared between tokens with different scopes.
+        url : str
+            Request URL.
+        params : dict | None
+            Optional request query parameters.
+
+        Returns
+        -------
+        key : str
+            Unique cache key for the request.
+        """
+        token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+        params = sorted((params or {}).items())
+        return f'{token_hash} GET {url} {params}'
+
+    def get(self, key):
+        """Retrieve a cached response row.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from make_key()
+
+        Returns
+        -------
+        out : dict | None
+            Dict with keys "etag", "last_modified", "status", "body",
+            "links", and "fetched_at", or None if the key is not cached.
+        """
+        query = ('SELECT etag, last_modified, status, body, links, '
+                 'fetched_at FROM responses WHERE key = ?')
+        with self._lock:
+            row = self._db.execute(query, (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        return {'etag': row[0], 'last_modified': row[1], 'status': row[2],
+                'body': row[3], 'links': json.loads(row[4]),
+                'fetched_at': row[5]}
+
+    def put(self, key, response):
+        """Cache a successful response.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from make_key()
+        response : requests.models.Response
+            Successful (200) response to cache.
+        """
+        etag = response.headers.get('ETag', None)
+        last_modified = response.headers.get('Last-Modified', None)
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES '
+                             '(?, ?, ?, ?, ?, ?, ?)',
+                             (key, etag, last_modified, response.status_code,
+                              response.content, json.dumps(response.links),
+                              time.time()))
+            self._db.commit()
+
+    def touch(self, key):
+        """Refresh the fetch time of a cached response, e.g. after a 304
+        Not Modified proved the entry is still current.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from make_key()
+        """
+        with self._lock:
+            self._db.execute('UPDATE responses SET fetched_at = ? '
+                             'WHERE key = ?', (time.time(), key))
+            self._db.commit()
+
+    def close(self):
+        """Close the sqlite connection."""
+        with self._lock:
+            self._db.close()
+
 
 class Github:
     """Class to call github api and return osos-formatted usage data."""
 
     BASE_REQ = 'https://api.github.com/repos/{owner}/{repo}'
+    GRAPHQL_URL = 'https://api.github.com/graphql'
     TIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
-    def __init__(self, owner, repo, token=None):
+    PER_PAGE = 100
+    """Default page size for paginated endpoints. The github api default is
+    30, so requesting the 100-item maximum cuts the request count 3-4x."""
+
+    RATE_LIMIT_FLOOR = 50
+    """Remaining-request threshold below which requests are paced out to
+    glide to the rate limit reset instead of slamming into a 403 wall."""
+
+    LIFETIMES_QUERY = """
+        query ($owner: String!, $repo: String!, $states: [{state_type}!],
+               $cursor: String) {{
+          repository(owner: $owner, name: $repo) {{
+            {field}(first: 100, states: $states, after: $cursor) {{
+              pageInfo {{ endCursor hasNextPage }}
+              nodes {{ number createdAt closedAt }}
+            }}
+          }}
+        }}"""
+
+    def __init__(self, owner, repo, token=None, use_cache=True, cache_ttl=0):
         """
         Parameters
         ----------
@@ -31,6 +218,16 @@ class Github:
         token : str | None
             Github api authorization token. If none this gets retrieved from
             the GITHUB_TOKEN environment variable
+        use_cache : bool
+            Flag to cache responses on disk and revalidate them with
+            conditional requests. Unchanged endpoints return 304 Not
+            Modified, which is free against the github rate limit.
+        cache_ttl : float
+            Time-to-live in seconds for cached responses. Cache entries
+            younger than this are returned without any network request at
+            all, e.g. cache_ttl=60 makes frequent reruns during development
+            skip the network entirely. The default of 0 always revalidates
+            with a conditional request.
         """
 
         self._owner = owner
@@ -50,6 +247,33 @@ class Github:
         else:
             logger.debug('Using github token from kwarg input to osos.')
 
+        # every request in this class targets api.github.com, so a single
+        # session reuses the TCP+TLS connection across paginated requests
+        # instead of tearing it down after every page.
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'token {self.token}'
+        retries = Retry(total=5, backoff_factor=0.5,
+                        status_forcelist=[502, 503, 504],
+                        respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                              max_retries=retries)
+        self.session.mount('https://', adapter)
+
+        self._cache = _CacheStore() if use_cache else None
+        self.cache_ttl = cache_ttl
+
+    def close(self):
+        """Close the cached http session and its pooled connections."""
+        self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
     def __str__(self):
         st = (f'Github API interface for https://github.com/'
               f'{self._owner}/{self._repo}/')
@@ -87,13 +311,10 @@ class Github:
             lifetime in days
         """
 
-        # github api has max 100 items per page. Use max to reduce the total
-        # number of requests.
         if 'params' in kwargs:
             kwargs['params']['state'] = state
-            kwargs['params']['per_page'] = 100
         else:
-            kwargs['params'] = {'state': state, 'per_page': 100}
+            kwargs['params'] = {'state': state}
 
         request = self.base_req + f'/{option}'
 
@@ -110,29 +331,30 @@ class Github:
             return out
 
         else:
-            items = self.get_generator(request, **kwargs)
-
-            numbers = []
-            lifetimes = []
-            for item in items:
-                d0 = item['created_at']
-                d1 = item['closed_at']
-                d0 = datetime.datetime.strptime(d0, self.TIME_FORMAT)
-                if state == 'closed' and d1 is not None:
-                    d1 = datetime.datetime.strptime(d1, self.TIME_FORMAT)
-                elif state == 'open':
-                    d1 = datetime.datetime.now()
-
-                assert d1 is not None, f'Bad final date for: {item}'
-
-                # pulls get listed as issues but not the other way around
-                condition_1 = option == 'pulls'
-                condition_2 = option == 'issues' and 'pull_request' not in item
-
-                if condition_1 or condition_2:
-                    numbers.append(item['number'])
-                    lifetime = (d1 - d0).total_seconds() / (24 * 3600)
-                    lifetimes.append(lifetime)
+            numbers, created, closed = self._get_lifetimes(option, state)
+
+            # the api can transiently report closed items with a null close
+            # timestamp - skip those instead of crashing the parser
+            if state == 'closed' and any(c is None for c in closed):
+                keep = [i for i, c in enumerate(closed) if c is not None]
+                logger.warning(f'Skipping {len(closed) - len(keep)} closed '
+                               f'{option} with missing close timestamps for '
+                               f'"{self._owner}/{self._repo}"')
+                numbers = [numbers[i] for i in keep]
+                created = [created[i] for i in keep]
+                closed = [closed[i] for i in keep]
+
+            # parse all timestamps at once with the C parser instead of
+            # calling strptime once per item in a python loop
+            t0 = pd.to_datetime(created, format=self.TIME_FORMAT,
+                                utc=True).asi8
+            if state == 'closed':
+                t1 = pd.to_datetime(closed, format=self.TIME_FORMAT,
+                                    utc=True).asi8
+            else:
+                t1 = np.int64(time.time() * 1e9)
+
+            lifetimes = ((t1 - t0) / (24 * 3600 * 1e9)).tolist()
 
             mean = np.nan if not any(lifetimes) else np.mean(lifetimes)
             median = np.nan if not any(lifetimes) else np.median(lifetimes)
@@ -163,7 +385,7 @@ class Github:
             datetime index with just the datetime.date part.
         """
         request = self.base_req + f'/traffic/{option}'
-        out = self.get_request(request, **kwargs).json()
+        out = self._loads(self.get_request(request, **kwargs))
         out = pd.DataFrame(out[option])
 
         if 'timestamp' in out:
@@ -194,7 +416,10 @@ class Github:
             Total number of items in all pages of the request
         """
 
-        req = self.get_request(request, **kwargs)
+        params = kwargs.pop('params', {})
+        params.setdefault('per_page', self.PER_PAGE)
+
+        req = self.get_request(request, params=params, **kwargs)
         num_pages = 1
         n_last = 0
 
@@ -207,10 +432,11 @@ class Github:
                 raise RuntimeError(msg)
 
             num_pages = int(match.group().replace('page=', '')) - 1
+            # last_url already carries the full query string
             last_page = self.get_request(last_url, **kwargs)
-            n_last = len(last_page.json())
+            n_last = len(self._loads(last_page))
 
-        out = len(req.json()) * num_pages + n_last
+        out = len(self._loads(req)) * num_pages + n_last
         return out
 
     def get_request(self, request, **kwargs):
@@ -226,14 +452,47 @@ class Github:
         Returns
         -------
         out : requests.models.Response
-            requests.get() output object.
+            requests.get() output object, or a cached equivalent if the
+            endpoint returned 304 Not Modified.
         """
 
-        headers = kwargs.pop('headers', {})
-        if 'Authorization' not in headers:
-            headers['Authorization'] = f'token {self.token}'
+        key = None
+        cached = None
+        if self._cache is not None:
+            key = self._cache.make_key(self.token, request,
+                                       kwargs.get('params', None))
+            cached = self._cache.get(key)
+            if cached is not None:
+                age = time.time() - cached['fetched_at']
+                if age < self.cache_ttl:
+                    logger.debug(f'Cache hit ({age:.0f}s old, within ttl) '
+                                 f'for: {request}')
+                    return _CachedResponse(cached['status'], cached['body'],
+                                           cached['links'])
+
+                headers = kwargs.pop('headers', {})
+                if cached['etag'] is not None:
+                    headers['If-None-Match'] = cached['etag']
+                if cached['last_modified'] is not None:
+                    headers['If-Modified-Since'] = cached['last_modified']
+                kwargs['headers'] = headers
+
+        out = self.session.get(request, **kwargs)
+
+        if out.status_code == 403 and 'Retry-After' in out.headers:
+            delay = int(out.headers['Retry-After'])
+            logger.warning(f'Github rate limited request to: {request}, '
+                           f'retrying after {delay} seconds.')
+            time.sleep(delay)
+            out = self.session.get(request, **kwargs)
+
+        if out.status_code == 304 and cached is not None:
+            logger.debug(f'Cache hit (304 Not Modified) for: {request}')
+            # the entry is proven current again, so restart its ttl clock
+            self._cache.touch(key)
+            return _CachedResponse(cached['status'], cached['body'],
+                                   cached['links'])
 
-        out = requests.get(request, headers=headers, **kwargs)
         if out.status_code != 200:
             msg = ('Received unexpected status code "{}" for reason "{}".'
                    '\nRequest: {}\nOutput: {}'
@@ -242,6 +501,11 @@ class Github:
             logger.error(msg)
             raise IOError(msg)
 
+        self._maybe_throttle(out)
+
+        if self._cache is not None:
+            self._cache.put(key, out)
+
         return out
 
     def get_generator(self, request, **kwargs):
@@ -261,27 +525,15 @@ class Github:
             generator of list items in the request output
         """
 
-        headers = kwargs.pop('headers', {})
-        if 'Authorization' not in headers:
-            headers['Authorization'] = f'token {self.token}'
-
         params = kwargs.pop('params', {})
+        params.setdefault('per_page', self.PER_PAGE)
         params['page'] = 0
 
         while True:
             params['page'] += 1
-            temp = requests.get(request, headers=headers, params=params,
-                                **kwargs)
-            if temp.status_code != 200:
-                msg = ('Received unexpected status code "{}" for reason "{}".'
-                       '\nRequest: {}\nOutput: {}'
-                       .format(temp.status_code, temp.reason, request,
-                               temp.text))
-                logger.error(msg)
-                raise IOError(msg)
-
-            temp = temp.json()
-            if not any(temp):
+            temp = self.get_request(request, params=params, **kwargs)
+            temp = self._loads(temp)
+            if not temp:
                 break
             elif not isinstance(temp, list):
                 msg = ('JSON output is type "{}", not list, could '
@@ -293,6 +545,152 @@ class Github:
                 for entry in temp:
                     yield entry
 
+    @staticmethod
+    def _loads(response):
+        """Parse a response body as json, using orjson when available.
+
+        orjson decodes the many-KB pages of the paginated endpoints several
+        times faster than the stdlib parser behind Response.json().
+
+        Parameters
+        ----------
+        response : requests.models.Response
+            Response (or cached equivalent) with a json body.
+
+        Returns
+        -------
+        out : dict | list
+            Parsed json response body.
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _maybe_throttle(self, response):
+        """Pace requests based on the github rate limit headers.
+
+        If the remaining request budget reported by the response is below
+        RATE_LIMIT_FLOOR, sleep a fraction of the time until the limit
+        resets so the budget is spread over the remaining window instead of
+        exhausting it and stalling on 403s.
+
+        Parameters
+        ----------
+        response : requests.models.Response
+            Response from a live (non-cached) github API request.
+        """
+
+        remaining = response.headers.get('X-RateLimit-Remaining', None)
+        reset = response.headers.get('X-RateLimit-Reset', None)
+        if remaining is None or reset is None:
+            return
+
+        remaining = int(remaining)
+        if remaining <= self.RATE_LIMIT_FLOOR:
+            delay = max(int(reset) - time.time(), 0) / (remaining + 1)
+            delay = min(delay, 60)
+            if delay > 0:
+                logger.warning('Github rate limit nearly exhausted '
+                               f'({remaining} requests remaining), sleeping '
+                               f'{delay:.1f} seconds.')
+                time.sleep(delay)
+
+    def _graphql(self, query, variables=None):
+        """Run a query against the github graphql API.
+
+        Parameters
+        ----------
+        query : str
+            Graphql query string.
+        variables : dict | None
+            Optional variables referenced by the query.
+
+        Returns
+        -------
+        out : dict
+            The "data" field of the graphql response.
+        """
+
+        out = self.session.post(self.GRAPHQL_URL,
+                                json={'query': query,
+                                      'variables': variables or {}})
+        if out.status_code != 200:
+            msg = ('Received unexpected status code "{}" for reason "{}".'
+                   '\nRequest: {}\nOutput: {}'
+                   .format(out.status_code, out.reason, self.GRAPHQL_URL,
+                           out.text))
+            logger.error(msg)
+            raise IOError(msg)
+
+        # graphql has its own rate limit pool separate from REST
+        self._maybe_throttle(out)
+
+        out = self._loads(out)
+        if out.get('errors', None):
+            msg = (f'Github graphql query returned errors: {out["errors"]}'
+                   f'\nQuery: {query}')
+            logger.error(msg)
+            raise IOError(msg)
+
+        return out['data']
+
+    def _get_lifetimes(self, option, state):
+        """Get creation/close timestamps for all issues or pulls in a given
+        state using the graphql API. One graphql request returns 100 items,
+        where the REST endpoint needs one request per 30 items plus parsing
+        of the full issue/pull payloads.
+
+        Parameters
+        ----------
+        option : str
+            "issues" or "pulls"
+        state : str
+            "open" or "closed"
+
+        Returns
+        -------
+        numbers : list
+            Issue/pull numbers.
+        created : list
+            Creation timestamp strings in TIME_FORMAT, same order as numbers.
+        closed : list
+            Close timestamp strings in TIME_FORMAT (None entries are
+            possible for open items), same order as numbers.
+        """
+
+        if option == 'issues':
+            field = 'issues'
+            state_type = 'IssueState'
+            states = [state.upper()]
+        else:
+            field = 'pullRequests'
+            state_type = 'PullRequestState'
+            # REST treats merged pulls as closed, graphql does not
+            states = ['CLOSED', 'MERGED'] if state == 'closed' else ['OPEN']
+
+        query = self.LIFETIMES_QUERY.format(field=field,
+                                            state_type=state_type)
+        variables = {'owner': self._owner, 'repo': self._repo,
+                     'states': states, 'cursor': None}
+
+        numbers = []
+        created = []
+        closed = []
+        while True:
+            data = self._graphql(query, variables)
+            conn = data['repository'][field]
+            for node in conn['nodes']:
+                numbers.append(node['number'])
+                created.append(node['createdAt'])
+                closed.append(node['closedAt'])
+
+            if not conn['pageInfo']['hasNextPage']:
+                break
+
+            variables['cursor'] = conn['pageInfo']['endCursor']
+
+        return numbers, created, closed
+
     def contributors(self, **kwargs):
         """Get the number of repo contributors
 
@@ -326,8 +724,24 @@ class Github:
         """
         logger.debug(f'Getting commit count for "{self._owner}/{self._repo}"')
         request = self.base_req + '/commits'
-        out = self._total_count(request, **kwargs)
-        return out
+
+        # with one item per page, the page number in the rel="last" link is
+        # the exact commit count - no need to download any commit payloads
+        params = kwargs.pop('params', {})
+        params['per_page'] = 1
+        req = self.get_request(request, params=params, **kwargs)
+
+        if 'last' not in req.links:
+            return len(self._loads(req))
+
+        last_url = req.links['last']['url']
+        match = re.search(r'[?&]page=([0-9]+)', last_url)
+        if not match:
+            msg = f'Could not find the page number in url: {last_url}'
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        return int(match.group(1))
 
     def commits(self, date_start=None, date_iter=None, search_all=False,
                 **kwargs):
@@ -364,29 +778,41 @@ class Github:
 
         logger.debug('Getting commit history for '
                      f'"{self._owner}/{self._repo}"')
-        out = pd.DataFrame(index=date_iter)
-        out['commits'] = 0
+
+        # map plain dates to the original index labels for O(1) lookup
+        # instead of scanning date_iter once per commit
+        targets = {pd.Timestamp(d).date(): d for d in date_iter}
+        min_date = min(targets)
+        max_date = max(targets)
+
+        # bound the query server-side so only commits inside the requested
+        # window are paged at all, instead of walking the full repo history
+        params = kwargs.pop('params', {})
+        if not search_all:
+            params.setdefault('since', min_date.isoformat() + 'T00:00:00Z')
+            params.setdefault(
+                'until', (max_date + datetime.timedelta(days=1)).isoformat()
+                + 'T00:00:00Z')
+
         request = self.base_req + '/commits'
-        commit_iter = self.get_generator(request, **kwargs)
+        commit_iter = self.get_generator(request, params=params, **kwargs)
+        counts = Counter()
         for com in commit_iter:
             c_date = com['commit']['committer']['date']
             c_date = datetime.datetime.strptime(c_date, self.TIME_FORMAT)
             c_date = c_date.date()
-            stop = True
-            for date in date_iter:
-                # print(date)
-                # if c_date == date.date():
-                if c_date == date:
-                    out.at[date, 'commits'] += 1
-                    stop = False
-                    break
-                # elif c_date > date.date():
-                elif c_date > date:
-                    stop = False
-
-            if stop and not search_all:
+            if c_date in targets:
+                counts[targets[c_date]] += 1
+            elif c_date < min_date and not search_all:
+                # commits come back newest-first, so everything after this
+                # is also before the requested dates
                 break
 
+        out = pd.DataFrame(index=date_iter)
+        out['commits'] = (pd.Series(counts, dtype=np.int64)
+                          .reindex(date_iter, fill_value=0)
+                          .values)
+
         return out
 
     def clones(self, **kwargs):
@@ -565,6 +991,67 @@ class Github:
         count = self._total_count(request, **kwargs)
         return count
 
+    def collect_all(self, date_iter=None, concurrency=8):
+        """Collect all github usage metrics concurrently.
+
+        The individual metric methods are pure I/O and independent of each
+        other, so fetching them with a small thread pool over the shared
+        session cuts the total wall time to roughly the slowest single
+        endpoint instead of the sum of all of them.
+
+        Parameters
+        ----------
+        date_iter : list | tuple | pd.DatetimeIndex | None
+            Optional iterable of dates to retrieve the daily commit
+            timeseries for. If None, the "commits" key is omitted.
+        concurrency : int
+            Number of concurrent requests to run.
+
+        Returns
+        -------
+        out : dict
+            Dict of metric outputs keyed by metric name: "issues_closed",
+            "issues_open", "pulls_closed", "pulls_open", "forks",
+            "stargazers", "subscribers", "contributors", "commit_count",
+            "clones", "views", and "commits" (if date_iter is given). The
+            "clones" and "views" keys are omitted with a warning if the
+            token does not have push access to the repo.
+        """
+
+        endpoints = {'clones': self.clones,
+                     'views': self.views,
+                     'issues_closed': self.issues_closed,
+                     'issues_open': self.issues_open,
+                     'pulls_closed': self.pulls_closed,
+                     'pulls_open': self.pulls_open,
+                     'forks': self.forks,
+                     'stargazers': self.stargazers,
+                     'subscribers': self.subscribers,
+                     'contributors': self.contributors,
+                     'commit_count': self.commit_count,
+                     }
+        if date_iter is not None:
+            endpoints['commits'] = partial(self.commits, date_iter=date_iter)
+
+        out = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as exe:
+            futures = {name: exe.submit(fun)
+                       for name, fun in endpoints.items()}
+            for name, future in futures.items():
+                try:
+                    out[name] = future.result()
+                except OSError:
+                    if name in ('clones', 'views'):
+                        msg = (f'Could not get github {name} data from '
+                               f'"{self._owner}/{self._repo}", try setting '
+                               'a GITHUB_TOKEN with push permissions.')
+                        warn(msg)
+                        logger.warning(msg)
+                    else:
+                        raise
+
+        return out
+
     def views(self, **kwargs):
         """Get the daily github repo views data for the last two weeks.
 
@@ -51,11 +51,25 @@ def main(ctx):
               'include the keywords "DATA_DIR" and "NAME" which will get '
               'replaced by the system location of the /osos/data/ directory '
               'and the github repo name, respectively.')
+@click.option('--no-cache', is_flag=True,
+              help='Flag to disable the on-disk github response cache. By '
+              'default, responses are cached and revalidated with cheap '
+              'conditional requests on subsequent runs.')
+@click.option('--cache-ttl', required=False, default=0, type=float,
+              show_default=True,
+              help='Time-to-live in seconds for cached github responses. '
+              'Cached entries younger than this skip the network entirely, '
+              'e.g. 60 for frequent reruns during development. The default '
+              'of 0 always revalidates with a conditional request.')
+@click.option('--jobs', '-j', required=False, default=None, type=int,
+              help='Number of parallel worker processes to run config rows '
+              'in. Defaults to one worker per row up to a maximum of 8. '
+              'Use 1 to run serially. Only applies to config-based runs.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def run(ctx, config, git_owner, git_repo, pypi_name, conda_org, conda_name,
-        fpath_out, verbose):
+        fpath_out, no_cache, cache_ttl, jobs, verbose):
     """Retrieve repo usage data using osos"""
 
     ctx.ensure_object(dict)
@@ -74,11 +88,13 @@ def run(ctx, config, git_owner, git_repo, pypi_name, conda_org, conda_name,
         init_logger('osos', log_level='INFO')
 
     if c1:
-        Osos.run_config(config)
+        Osos.run_config(config, use_cache=not no_cache, cache_ttl=cache_ttl,
+                        max_workers=jobs)
     else:
-        osos = Osos(git_owner, git_repo, pypi_name=pypi_name,
-                    conda_org=conda_org, conda_name=conda_name)
-        osos.update(fpath_out)
+        with Osos(git_owner, git_repo, pypi_name=pypi_name,
+                  conda_org=conda_org, conda_name=conda_name,
+                  use_cache=not no_cache, cache_ttl=cache_ttl) as osos:
+            osos.update(fpath_out)
 
 
 @main.command()
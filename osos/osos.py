@@ -5,7 +5,7 @@ import datetime
 import os
 import pandas as pd
 import logging
-from warnings import warn
+from concurrent.futures import ProcessPoolExecutor
 from osos.api_github import Github
 from osos.api_pypi import Pypi
 from osos.api_conda import Conda
@@ -17,13 +17,48 @@ DATA_DIR = os.path.join(os.path.dirname(OSOS_DIR), 'data')
 logger = logging.getLogger(__name__)
 
 
+def _run_config_row(row, use_cache=True, cache_ttl=0):
+    """Run a single osos job from a config row. Module-level so it can be
+    pickled into ProcessPoolExecutor workers by Osos.run_config.
+
+    Parameters
+    ----------
+    row : dict
+        Single config row with keys for git_owner, git_repo, fpath_out, and
+        (optionally) pypi_name, conda_org, and conda_name.
+    use_cache : bool
+        Flag to cache github API responses on disk and revalidate them
+        with cheap conditional requests on subsequent runs.
+    cache_ttl : float
+        Time-to-live in seconds for cached github responses.
+    """
+
+    conda_org = row.get('conda_org', None)
+    conda_name = row.get('conda_name', None)
+    pypi_name = row.get('pypi_name', None)
+    conda_org = conda_org if isinstance(conda_org, str) else None
+    conda_name = conda_name if isinstance(conda_name, str) else None
+    pypi_name = pypi_name if isinstance(pypi_name, str) else None
+
+    fpath_out = row['fpath_out'].replace('DATA_DIR', DATA_DIR)
+    fpath_out = fpath_out.replace('NAME', row['git_repo'])
+
+    with Osos(row['git_owner'], row['git_repo'],
+              pypi_name=pypi_name,
+              conda_org=conda_org,
+              conda_name=conda_name,
+              use_cache=use_cache,
+              cache_ttl=cache_ttl) as osos:
+        osos.update(fpath_out)
+
+
 class Osos:
     """Base class to handle open source ops and statistics (osos) for a given
     repo/package.
     """
 
     def __init__(self, git_owner, git_repo, pypi_name=None, conda_org=None,
-                 conda_name=None):
+                 conda_name=None, use_cache=True, cache_ttl=0):
         """
         Parameters
         ----------
@@ -43,6 +78,13 @@ class Osos:
         conda_name : str
             Conda package name, for example:
             https://anaconda.org/{org}/{name}. Case insensitive.
+        use_cache : bool
+            Flag to cache github API responses on disk and revalidate them
+            with cheap conditional requests on subsequent runs.
+        cache_ttl : float
+            Time-to-live in seconds for cached github responses. Cached
+            entries younger than this skip the network entirely. The default
+            of 0 always revalidates with a conditional request.
         """
 
         self._git_owner = git_owner
@@ -51,12 +93,23 @@ class Osos:
         self._conda_org = conda_org
         self._conda_name = conda_name
 
-        self._gh = Github(self._git_owner, self._git_repo)
+        self._gh = Github(self._git_owner, self._git_repo,
+                          use_cache=use_cache, cache_ttl=cache_ttl)
 
         d0 = datetime.date.today()
         d1 = datetime.date.today() - datetime.timedelta(days=13)
         self._index = pd.date_range(d1, d0, freq='1D').date
 
+    def close(self):
+        """Close the cached github API session."""
+        self._gh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
     def clean_table(self, table):
         """Fill nan values and make sure the timeseries index has 14 days.
 
@@ -105,33 +158,19 @@ class Osos:
 
         table = pd.DataFrame(index=self._index)
 
-        try:
-            table = table.join(self._gh.clones())
-            table = table.join(self._gh.views())
-        except OSError:
-            msg = ('Could not get github clone/views data from '
-                   f'"{self._git_owner}/{self._git_repo}", '
-                   'try setting a GITHUB_TOKEN with push permissions.')
-            warn(msg)
-            logger.warning(msg)
-
-        issues_pulls = (self._gh.issues_closed(),
-                        self._gh.issues_open(),
-                        self._gh.pulls_closed(),
-                        self._gh.pulls_open())
-        options = (('issues', 'closed'), ('issues', 'open'),
-                   ('pulls', 'closed'), ('pulls', 'open'))
-
-        for ip_count, (op1, op2) in zip(issues_pulls, options):
-            table[f'{op1}_{op2}'] = ip_count
-
-        table['forks'] = self._gh.forks()
-        table['stargazers'] = self._gh.stargazers()
-        table['subscribers'] = self._gh.subscribers()
-        table['contributors'] = self._gh.contributors()
-
-        table = table.join(self._gh.commits(date_iter=self._index))
-        table['total_commits'] = self._gh.commit_count()
+        gh_out = self._gh.collect_all(date_iter=self._index)
+
+        for col in ('clones', 'views'):
+            if col in gh_out:
+                table = table.join(gh_out[col])
+
+        for col in ('issues_closed', 'issues_open', 'pulls_closed',
+                    'pulls_open', 'forks', 'stargazers', 'subscribers',
+                    'contributors'):
+            table[col] = gh_out[col]
+
+        table = table.join(gh_out['commits'])
+        table['total_commits'] = gh_out['commit_count']
 
         if self._pypi_name is not None:
             pypi_out = Pypi.get_daily_data(self._pypi_name, table.index.values)
@@ -184,19 +223,42 @@ class Osos:
         return table
 
     @classmethod
-    def run_config(cls, config):
+    def run_config(cls, config, use_cache=True, cache_ttl=0,
+                   max_workers=None):
         """Run multiple osos jobs from a csv config.
 
+        Each config row hits a different repo and writes a different file,
+        so rows run in parallel worker processes, each with its own session
+        and rate limit accounting.
+
         Parameters
         ----------
         config : str
             Path to .csv config file with columns for git_owner, git_repo,
             fpath_out, and (optionally) pypi_name, conda_org, and conda_name.
+        use_cache : bool
+            Flag to cache github API responses on disk and revalidate them
+            with cheap conditional requests on subsequent runs.
+        cache_ttl : float
+            Time-to-live in seconds for cached github responses. Cached
+            entries younger than this skip the network entirely. The default
+            of 0 always revalidates with a conditional request.
+        max_workers : int | None
+            Number of parallel worker processes to run config rows in.
+            Defaults to one worker per row up to a maximum of 8. Use 1 to
+            run serially.
         """
 
         assert os.path.exists(config), 'config must be a valid filepath'
         assert config.endswith('.csv'), 'config must be .csv'
-        config = pd.read_csv(config)
+
+        try:
+            import pyarrow  # noqa: F401
+            engine = 'pyarrow'
+        except ImportError:
+            engine = 'c'
+
+        config = pd.read_csv(config, engine=engine)
 
         required = ('git_owner', 'git_repo', 'fpath_out')
         missing = [r for r in required if r not in config]
@@ -205,22 +267,19 @@ class Osos:
             logger.error(msg)
             raise KeyError(msg)
 
-        for _, row in config.iterrows():
-            row = row.to_dict()
-
-            conda_org = row.get('conda_org', None)
-            conda_name = row.get('conda_name', None)
-            pypi_name = row.get('pypi_name', None)
-            conda_org = conda_org if isinstance(conda_org, str) else None
-            conda_name = conda_name if isinstance(conda_name, str) else None
-            pypi_name = pypi_name if isinstance(pypi_name, str) else None
-
-            fpath_out = row['fpath_out'].replace('DATA_DIR', DATA_DIR)
-            fpath_out = row['fpath_out'].replace('NAME', row['git_repo'])
-
-            osos = cls(row['git_owner'], row['git_repo'],
-                       pypi_name=pypi_name,
-                       conda_org=conda_org,
-                       conda_name=conda_name)
-
-            osos.update(fpath_out)
+        rows = config.to_dict('records')
+        if max_workers is None:
+            max_workers = min(8, len(rows))
+
+        if max_workers <= 1:
+            for row in rows:
+                _run_config_row(row, use_cache=use_cache,
+                                cache_ttl=cache_ttl)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as exe:
+                futures = [exe.submit(_run_config_row, row,
+                                      use_cache=use_cache,
+                                      cache_ttl=cache_ttl)
+                           for row in rows]
+                for future in futures:
+                    future.result()
@@ -3,8 +3,64 @@
 Test for pypi API
 """
 import datetime
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from osos.api_github.api_github import Github
+from osos.api_github.api_github import Github, _CacheStore
+
+
+def test_cache_store():
+    """Test the on-disk response cache roundtrip"""
+
+    class FakeResponse:
+        """Minimal response-like object for caching"""
+        status_code = 200
+        content = b'[{"number": 1}]'
+        headers = {'ETag': 'W/"abc123"'}
+        links = {'last': {'url': 'https://api.github.com/x?page=2'}}
+
+    with tempfile.TemporaryDirectory() as td:
+        fpath = os.path.join(td, 'http.sqlite')
+        cache = _CacheStore(fpath)
+        key = cache.make_key('token', 'https://api.github.com/x',
+                             {'page': 1, 'per_page': 100})
+
+        assert cache.get(key) is None
+        cache.put(key, FakeResponse())
+        row = cache.get(key)
+        assert row['etag'] == 'W/"abc123"'
+        assert row['status'] == 200
+        assert row['body'] == FakeResponse.content
+        assert row['links'] == FakeResponse.links
+        cache.close()
+
+
+def test_cache_store_threaded():
+    """Test that one cache store can be shared across worker threads like
+    collect_all does with the Github instance cache"""
+
+    class FakeResponse:
+        """Minimal response-like object for caching"""
+        status_code = 200
+        content = b'[]'
+        headers = {'ETag': 'W/"abc123"'}
+        links = {}
+
+    def roundtrip(i):
+        key = cache.make_key('token', f'https://api.github.com/x/{i}')
+        cache.put(key, FakeResponse())
+        return cache.get(key)
+
+    with tempfile.TemporaryDirectory() as td:
+        fpath = os.path.join(td, 'http.sqlite')
+        cache = _CacheStore(fpath)
+        with ThreadPoolExecutor(max_workers=8) as exe:
+            rows = list(exe.map(roundtrip, range(50)))
+
+        assert all(row is not None for row in rows)
+        assert all(row['etag'] == 'W/"abc123"' for row in rows)
+        cache.close()
 
 
 def test_clones():
@@ -122,6 +178,23 @@ def test_commit_count():
     assert count >= 2217
 
 
+def test_collect_all():
+    """Test the concurrent collection of all github metrics"""
+    d0 = datetime.date.today() - datetime.timedelta(days=13)
+    date_iter = [d0 + datetime.timedelta(days=i) for i in range(14)]
+    gh = Github('NREL', 'reV')
+    out = gh.collect_all(date_iter=date_iter)
+
+    for key in ('issues_closed', 'issues_open', 'pulls_closed', 'pulls_open',
+                'forks', 'stargazers', 'subscribers', 'contributors',
+                'commit_count'):
+        assert key in out
+        assert isinstance(out[key], int)
+
+    assert 'commits' in out
+    assert len(out['commits']) == 14
+
+
 def test_commit_record():
     """Test the github timeseries commit record"""
     d0 = datetime.date.today() - datetime.timedelta(days=14)